@@ -0,0 +1,31 @@
+# 2D arrays and dtypes
+
+import numpy as np
+
+# A mixed literal like np.array([[2, 3, 4], ['Exu', 'Ogum', 'Oxossi'], ['333', '777', '222']])
+# forces dtype '<U*': every element (including the ints) becomes a unicode
+# string (~24 bytes each) and arithmetic falls back to Python objects.
+# Keep numbers and labels in separate, properly typed arrays instead.
+
+numbers = np.array([[2, 3, 4], [333, 777, 222]], dtype=np.int64)
+labels = np.array(['Exu', 'Ogum', 'Oxossi'])
+
+print(numbers)
+print(numbers.dtype)   # int64 -> 8 bytes/element, native compare
+print(numbers.nbytes)  # 48 bytes vs 144 if these six values were '<U6' strings
+
+# Indexing works the same, but now arithmetic is vectorized C loops
+print(numbers[0, 1])       # 3
+print(numbers[:, 2])       # [  4 222]
+print(numbers * 2)         # SIMD-vectorized, no string decode
+print(labels[numbers[0] % 3])  # labels can still be looked up by index
+
+# If a single "table" is really needed, a structured dtype keeps each
+# column contiguous and typed:
+table = np.array(
+    [(2, 'Exu'), (333, 'Ogum'), (777, 'Oxossi')],
+    dtype=np.dtype([('n', 'i8'), ('name', 'U8')])
+)
+print(table['n'])      # int64 column
+print(table['name'])   # unicode column
+print(table[table['n'] > 100]['name'])
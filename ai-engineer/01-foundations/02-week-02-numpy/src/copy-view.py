@@ -0,0 +1,42 @@
+# Views, copies and memory layout
+
+import numpy as np
+
+
+def contig(a):
+    """Return `a` itself if C-contiguous, else a contiguous copy of it."""
+    return a if a.flags['C_CONTIGUOUS'] else np.ascontiguousarray(a)
+
+
+original = np.arange(12, dtype=np.int64).reshape(3, 4)
+
+# A row slice of a C-contiguous array is still C-contiguous...
+fatia = original[0:2, :]
+print(fatia.base is original)          # True -> view, no copy
+print(fatia.flags['C_CONTIGUOUS'])     # True
+
+# ...but a column slice produces strided memory
+column_slice = original[:, 0:2]
+print(column_slice.base is original)   # True -> still a view
+print(column_slice.flags['C_CONTIGUOUS'])  # False!
+
+# Strided views make compiled consumers (Numba nopython, BLAS) either
+# reject the array or silently copy it inside the hot loop. Normalize
+# once, up front, before handing views to compiled kernels:
+print(contig(fatia) is fatia)                # already contiguous -> no copy
+fixed = contig(column_slice)
+print(fixed.flags['C_CONTIGUOUS'])           # True
+print(fixed.base is original)                # False -> it's a copy now
+
+# Writing through a view mutates the original; a copy doesn't
+fatia[0, 0] = 99
+print(original[0, 0])  # 99
+fixed[0, 0] = -1
+print(original[0, 0])  # still 99
+
+# The two copy spellings default differently: the np.copy() *function*
+# uses order='K' and keeps the source's memory ordering, while the
+# .copy() *method* defaults to order='C' and always gives C-contiguous.
+fortran = np.asfortranarray(original)
+print(np.copy(fortran).flags['C_CONTIGUOUS'])  # False — 'K' kept F order
+print(fortran.copy().flags['C_CONTIGUOUS'])    # True — method defaults to 'C'
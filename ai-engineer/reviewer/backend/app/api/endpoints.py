@@ -1,8 +1,10 @@
+import time
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from pydantic import BaseModel
-from datetime import date
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from datetime import date, datetime, timedelta
 
 from app.db.session import get_db
 from app.services.card_service import CardService
@@ -11,6 +13,29 @@ from app.repositories.weekly_checkin_repository import WeeklyCheckInRepository
 
 router = APIRouter()
 
+# In-process TTL cache for the read-mostly endpoints; write endpoints
+# invalidate their keys so stale data never outlives a mutation.
+MONTHS_CACHE_TTL = 30  # seconds
+_cache = {}
+_CACHE_MISS = object()
+
+def _cache_get(key):
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return _CACHE_MISS
+
+def _cache_set(key, value, ttl: float):
+    _cache[key] = (time.monotonic() + ttl, value)
+
+def _cache_invalidate(key):
+    _cache.pop(key, None)
+
+def _seconds_until_midnight() -> float:
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (midnight - now).total_seconds()
+
 class CardCreate(BaseModel):
     question: str
     month_id: Optional[int] = None
@@ -22,9 +47,8 @@ class CardResponse(BaseModel):
     current_stage: int
     next_review_date: date
     month_id: Optional[int] = None
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 class StudyMonthCreate(BaseModel):
     title: str
@@ -34,9 +58,8 @@ class StudyMonthResponse(BaseModel):
     id: int
     title: str
     number: int
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 class CheckInCreate(BaseModel):
     answers: dict
@@ -49,76 +72,111 @@ class CheckInResponse(BaseModel):
     q3: bool
     q4: bool
     q5: bool
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CardBulkCreate(BaseModel):
+    items: List[CardCreate]
 
 class ReviewRequest(BaseModel):
     success: bool
 
+# Compiled list adapters: validating a whole list in one pydantic-core
+# call is much cheaper than instantiating a model per ORM row
+_cards_adapter = TypeAdapter(List[CardResponse])
+_months_adapter = TypeAdapter(List[StudyMonthResponse])
+
+@router.get("/healthz")
+async def healthz(db: AsyncSession = Depends(get_db)):
+    # Also serves to warm a pool connection after deploy
+    await db.execute(text("SELECT 1"))
+    return {"ok": True}
+
 @router.post("/cards", response_model=CardResponse)
-def create_card(card: CardCreate, db: Session = Depends(get_db)):
+async def create_card(card: CardCreate, db: AsyncSession = Depends(get_db)):
+    service = CardService(db)
+    return await service.create_card(card.question, card.month_id, card.current_stage)
+
+@router.post("/cards/bulk", response_model=List[CardResponse])
+async def bulk_create_cards(payload: CardBulkCreate, db: AsyncSession = Depends(get_db)):
     service = CardService(db)
-    return service.create_card(card.question, card.month_id, card.current_stage)
+    cards = await service.create_cards([item.model_dump() for item in payload.items])
+    return _cards_adapter.validate_python(cards)
 
 @router.get("/cards", response_model=List[CardResponse])
-def get_cards(db: Session = Depends(get_db)):
+async def get_cards(db: AsyncSession = Depends(get_db)):
     service = CardService(db)
-    return service.get_all_cards()
+    return _cards_adapter.validate_python(await service.get_all_cards())
 
 @router.get("/cards/today", response_model=List[CardResponse])
-def get_cards_today(db: Session = Depends(get_db)):
+async def get_cards_today(db: AsyncSession = Depends(get_db)):
     service = CardService(db)
-    return service.get_pending_cards()
+    return _cards_adapter.validate_python(await service.get_pending_cards())
 
 @router.post("/cards/{card_id}/review", response_model=CardResponse)
-def review_card(card_id: int, review: ReviewRequest, db: Session = Depends(get_db)):
+async def review_card(card_id: int, review: ReviewRequest, db: AsyncSession = Depends(get_db)):
     service = CardService(db)
-    updated_card = service.process_review(card_id, review.success)
+    updated_card = await service.process_review(card_id, review.success)
     if not updated_card:
         raise HTTPException(status_code=404, detail="Card not found")
     return updated_card
 
 @router.put("/cards/{card_id}", response_model=CardResponse)
-def update_card(card_id: int, card: CardCreate, db: Session = Depends(get_db)):
+async def update_card(card_id: int, card: CardCreate, db: AsyncSession = Depends(get_db)):
     service = CardService(db)
-    updated_card = service.update_card_question(card_id, card.question)
+    updated_card = await service.update_card_question(card_id, card.question)
     if not updated_card:
         raise HTTPException(status_code=404, detail="Card not found")
     return updated_card
 
 @router.delete("/cards/{card_id}")
-def delete_card(card_id: int, db: Session = Depends(get_db)):
+async def delete_card(card_id: int, db: AsyncSession = Depends(get_db)):
     service = CardService(db)
-    card = service.delete_card(card_id)
+    card = await service.delete_card(card_id)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
     return {"ok": True}
 
 @router.get("/months", response_model=List[StudyMonthResponse])
-def get_months(db: Session = Depends(get_db)):
+async def get_months(db: AsyncSession = Depends(get_db)):
+    cached = _cache_get("months")
+    if cached is not _CACHE_MISS:
+        return cached
     repo = StudyMonthRepository(db)
-    return repo.get_all()
+    months = _months_adapter.validate_python(await repo.get_all())
+    _cache_set("months", months, MONTHS_CACHE_TTL)
+    return months
 
 @router.post("/months", response_model=StudyMonthResponse)
-def create_month(month: StudyMonthCreate, db: Session = Depends(get_db)):
+async def create_month(month: StudyMonthCreate, db: AsyncSession = Depends(get_db)):
     repo = StudyMonthRepository(db)
-    return repo.create(month.title, month.number)
+    created = await repo.create(month.title, month.number)
+    _cache_invalidate("months")
+    return created
 
 @router.delete("/months/{month_id}")
-def delete_month(month_id: int, db: Session = Depends(get_db)):
+async def delete_month(month_id: int, db: AsyncSession = Depends(get_db)):
     repo = StudyMonthRepository(db)
-    success = repo.delete(month_id)
+    success = await repo.delete(month_id)
     if not success:
         raise HTTPException(status_code=404, detail="Month not found")
+    _cache_invalidate("months")
     return {"ok": True}
 
 @router.get("/checkins/today", response_model=Optional[CheckInResponse])
-def get_today_checkin(db: Session = Depends(get_db)):
+async def get_today_checkin(db: AsyncSession = Depends(get_db)):
+    key = f"checkin:{date.today().isoformat()}"
+    cached = _cache_get(key)
+    if cached is not _CACHE_MISS:
+        return cached
     repo = WeeklyCheckInRepository(db)
-    return repo.get_by_date(date.today())
+    checkin = await repo.get_by_date(date.today())
+    _cache_set(key, checkin, _seconds_until_midnight())
+    return checkin
 
 @router.post("/checkins", response_model=CheckInResponse)
-def submit_checkin(checkin: CheckInCreate, db: Session = Depends(get_db)):
+async def submit_checkin(checkin: CheckInCreate, db: AsyncSession = Depends(get_db)):
     repo = WeeklyCheckInRepository(db)
-    return repo.create(date.today(), checkin.answers)
\ No newline at end of file
+    created = await repo.create(date.today(), checkin.answers)
+    _cache_invalidate(f"checkin:{date.today().isoformat()}")
+    return created
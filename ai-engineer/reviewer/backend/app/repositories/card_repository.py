@@ -1,37 +1,53 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from app.models.card import Card
 from datetime import date
 
 class CardRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, question: str, month_id: int = None, current_stage: int = 0, next_review_date: date = None):
+    async def create(self, question: str, month_id: int = None, current_stage: int = 0, next_review_date: date = None):
         if next_review_date is None:
             next_review_date = date.today()
         card = Card(question=question, month_id=month_id, current_stage=current_stage, next_review_date=next_review_date)
         self.db.add(card)
-        self.db.commit()
-        self.db.refresh(card)
+        await self.db.commit()
+        await self.db.refresh(card)
         return card
 
-    def get_all(self):
-        return self.db.query(Card).all()
+    async def create_many(self, rows: list, chunk_size: int = 500):
+        # One INSERT per chunk and a single commit instead of N add/commit/refresh cycles
+        created = []
+        for i in range(0, len(rows), chunk_size):
+            chunk = rows[i:i + chunk_size]
+            result = await self.db.execute(insert(Card).values(chunk).returning(Card))
+            created.extend(result.scalars().all())
+        await self.db.commit()
+        return created
 
-    def get_pending(self):
-        return self.db.query(Card).filter(Card.next_review_date <= date.today()).all()
+    async def get_all(self):
+        result = await self.db.execute(select(Card).options(selectinload(Card.month)))
+        return result.scalars().all()
 
-    def get_by_id(self, card_id: int):
-        return self.db.query(Card).filter(Card.id == card_id).first()
+    async def get_pending(self):
+        result = await self.db.execute(
+            select(Card).options(selectinload(Card.month)).where(Card.next_review_date <= date.today())
+        )
+        return result.scalars().all()
 
-    def update(self, card: Card):
-        self.db.commit()
-        self.db.refresh(card)
+    async def get_by_id(self, card_id: int):
+        return await self.db.get(Card, card_id)
+
+    async def update(self, card: Card):
+        await self.db.commit()
+        await self.db.refresh(card)
         return card
-        
-    def delete(self, card_id: int):
-        card = self.get_by_id(card_id)
+
+    async def delete(self, card_id: int):
+        card = await self.get_by_id(card_id)
         if card:
-            self.db.delete(card)
-            self.db.commit()
+            await self.db.delete(card)
+            await self.db.commit()
         return card
@@ -1,38 +1,49 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.study_month import StudyMonth
 
 class StudyMonthRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, title: str, number: int = None):
-        if number is None:
-            max_num = self.db.query(StudyMonth).order_by(StudyMonth.number.desc()).first()
-            number = (max_num.number + 1) if max_num else 1
-        
-        # Check if number already exists to avoid crash
-        existing = self.db.query(StudyMonth).filter(StudyMonth.number == number).first()
-        if existing:
-            # If exists, get the next available
-            max_num = self.db.query(StudyMonth).order_by(StudyMonth.number.desc()).first()
-            number = max_num.number + 1
+    async def create(self, title: str, number: int = None):
+        # Single INSERT .. RETURNING: the next number is computed in-query,
+        # so two concurrent creates can't pick the same one. Retried on the
+        # UNIQUE constraint in case an explicit number collides.
+        for attempt in range(3):
+            if number is None:
+                next_number = func.coalesce(func.max(StudyMonth.number), 0) + 1
+                stmt = insert(StudyMonth).from_select(
+                    ["title", "number"],
+                    select(literal(title), next_number)
+                ).returning(StudyMonth)
+            else:
+                stmt = insert(StudyMonth).values(title=title, number=number).returning(StudyMonth)
 
-        month = StudyMonth(title=title, number=number)
-        self.db.add(month)
-        self.db.commit()
-        self.db.refresh(month)
-        return month
+            try:
+                result = await self.db.execute(stmt)
+                month = result.scalar_one()
+                await self.db.commit()
+                return month
+            except IntegrityError:
+                await self.db.rollback()
+                if attempt == 2:
+                    raise
+                # Explicit number taken: fall back to the computed next one
+                number = None
 
-    def get_all(self):
-        return self.db.query(StudyMonth).order_by(StudyMonth.number).all()
+    async def get_all(self):
+        result = await self.db.execute(select(StudyMonth).order_by(StudyMonth.number))
+        return result.scalars().all()
 
-    def get_by_id(self, month_id: int):
-        return self.db.query(StudyMonth).filter(StudyMonth.id == month_id).first()
+    async def get_by_id(self, month_id: int):
+        return await self.db.get(StudyMonth, month_id)
 
-    def delete(self, month_id: int):
-        month = self.get_by_id(month_id)
+    async def delete(self, month_id: int):
+        month = await self.get_by_id(month_id)
         if month:
-            self.db.delete(month)
-            self.db.commit()
+            await self.db.delete(month)
+            await self.db.commit()
             return True
         return False
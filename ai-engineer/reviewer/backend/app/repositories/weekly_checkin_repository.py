@@ -1,12 +1,13 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.weekly_checkin import WeeklyCheckIn
 from datetime import date
 
 class WeeklyCheckInRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, date_val: date, answers: dict):
+    async def create(self, date_val: date, answers: dict):
         checkin = WeeklyCheckIn(
             date=date_val,
             q1=answers.get('q1', False),
@@ -16,12 +17,14 @@ class WeeklyCheckInRepository:
             q5=answers.get('q5', False)
         )
         self.db.add(checkin)
-        self.db.commit()
-        self.db.refresh(checkin)
+        await self.db.commit()
+        await self.db.refresh(checkin)
         return checkin
 
-    def get_by_date(self, date_val: date):
-        return self.db.query(WeeklyCheckIn).filter(WeeklyCheckIn.date == date_val).first()
+    async def get_by_date(self, date_val: date):
+        result = await self.db.execute(select(WeeklyCheckIn).where(WeeklyCheckIn.date == date_val))
+        return result.scalars().first()
 
-    def get_all(self):
-        return self.db.query(WeeklyCheckIn).order_by(WeeklyCheckIn.date.desc()).all()
+    async def get_all(self):
+        result = await self.db.execute(select(WeeklyCheckIn).order_by(WeeklyCheckIn.date.desc()))
+        return result.scalars().all()
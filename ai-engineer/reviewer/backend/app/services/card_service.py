@@ -1,39 +1,58 @@
 import os
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.card_repository import CardRepository
 from app.repositories.review_repository import ReviewRepository
 from app.services.spaced_repetition import calculate_next_review
 
 class CardService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.card_repo = CardRepository(db)
         self.review_repo = ReviewRepository(db)
         self.reset_to = os.getenv("REVIEW_RESET_TO", "D2")
 
-    def create_card(self, question: str, month_id: int = None, current_stage: int = 0):
+    async def create_card(self, question: str, month_id: int = None, current_stage: int = 0):
         from app.services.spaced_repetition import CYCLE
         from datetime import datetime, timedelta
-        
+
         days_to_add = 0
         if 0 <= current_stage < len(CYCLE):
             days_to_add = CYCLE[current_stage]
-        
+
         next_review_date = datetime.now().date() + timedelta(days=days_to_add)
-        return self.card_repo.create(question, month_id, current_stage, next_review_date)
+        return await self.card_repo.create(question, month_id, current_stage, next_review_date)
 
-    def get_all_cards(self):
-        return self.card_repo.get_all()
+    async def create_cards(self, items: list):
+        from app.services.spaced_repetition import CYCLE
+        from datetime import datetime, timedelta
 
-    def get_pending_cards(self):
-        return self.card_repo.get_pending()
+        today = datetime.now().date()
+        rows = []
+        for item in items:
+            current_stage = item.get('current_stage') or 0
+            days_to_add = 0
+            if 0 <= current_stage < len(CYCLE):
+                days_to_add = CYCLE[current_stage]
+            rows.append({
+                'question': item['question'],
+                'month_id': item.get('month_id'),
+                'current_stage': current_stage,
+                'next_review_date': today + timedelta(days=days_to_add)
+            })
+        return await self.card_repo.create_many(rows)
 
-    def process_review(self, card_id: int, success: bool):
-        card = self.card_repo.get_by_id(card_id)
+    async def get_all_cards(self):
+        return await self.card_repo.get_all()
+
+    async def get_pending_cards(self):
+        return await self.card_repo.get_pending()
+
+    async def process_review(self, card_id: int, success: bool):
+        card = await self.card_repo.get_by_id(card_id)
         if not card:
             return None
 
         # Log review
-        self.review_repo.create(card_id=card.id, stage=card.current_stage, success=success)
+        await self.review_repo.create(card_id=card.id, stage=card.current_stage, success=success)
 
         # Calculate next
         next_stage, next_date = calculate_next_review(card.current_stage, success, self.reset_to)
@@ -41,14 +60,14 @@ class CardService:
         # Update card
         card.current_stage = next_stage
         card.next_review_date = next_date
-        return self.card_repo.update(card)
-        
-    def delete_card(self, card_id: int):
-        return self.card_repo.delete(card_id)
+        return await self.card_repo.update(card)
+
+    async def delete_card(self, card_id: int):
+        return await self.card_repo.delete(card_id)
 
-    def update_card_question(self, card_id: int, question: str):
-        card = self.card_repo.get_by_id(card_id)
+    async def update_card_question(self, card_id: int, question: str):
+        card = await self.card_repo.get_by_id(card_id)
         if card:
             card.question = question
-            return self.card_repo.update(card)
-        return None
\ No newline at end of file
+            return await self.card_repo.update(card)
+        return None
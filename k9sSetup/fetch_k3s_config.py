@@ -30,6 +30,7 @@ from dotenv import load_dotenv
 from pathlib import Path
 import subprocess
 import hashlib
+import threading
 import questionary
 
 # Import local modules
@@ -70,6 +71,11 @@ else:
 TUNNEL_STATE_DIR = Path.home() / ".local" / "state" / "k9s-tunnels"
 CACHE_DIR = Path.home() / ".cache" / "k9s-config"
 
+# merge_kubeconfig is a read-modify-write of the shared ~/.kube/config;
+# concurrent merges (multi_connect fans connections out over threads)
+# would each read the same base file and the last writer would win
+_MERGE_LOCK = threading.Lock()
+
 
 def fetch_and_merge_kubeconfig(
     company: str,
@@ -146,8 +152,10 @@ def fetch_and_merge_kubeconfig(
             use_localhost=True, local_port=local_port
         )
 
-        # Merge into ~/.kube/config
-        merge_kubeconfig(new_content, context_name)
+        # Merge into ~/.kube/config — serialized so parallel connects
+        # can't drop each other's contexts
+        with _MERGE_LOCK:
+            merge_kubeconfig(new_content, context_name)
 
         return context_name, local_port, internal_ip, new_content, was_cached
     finally:
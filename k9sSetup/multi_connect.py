@@ -15,63 +15,79 @@ This script:
 5. Sets first cluster as active context
 """
 
+import asyncio
 import os
 import sys
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
-import questionary
-from questionary import Style
-from dotenv import load_dotenv
-
-# Import local modules
-from src.inventory import load_inventories, extract_hosts_from_inventory
-from src.network import check_vpn_requirement, check_network_requirement
-from src.ssh import load_ssh_config
+
+# Import local modules (heavy imports — questionary, dotenv, paramiko via
+# fetch_k3s_config — are deferred to _bootstrap()/call sites so that
+# importing this module stays cheap)
+from src.inventory import load_inventories, extract_hosts_from_inventory, build_vpn_map
+from src.network import check_network_requirement
 from src.tunnel import (
     is_tunnel_running, create_tunnel, save_tunnel_pid,
     save_network_metadata, TUNNEL_STATE_DIR
 )
 from src.logging_config import setup_logging, get_logger
-from fetch_k3s_config import fetch_and_merge_kubeconfig
-
-# Load environment variables
-load_dotenv()
-
-# Load config
-from src.config import load_config, get_config_value
-CONFIG_FILE = os.getenv("CONFIG_FILE", str(Path(__file__).parent / "config.yaml"))
-config = load_config(os.path.expanduser(CONFIG_FILE))
-
-# Configuration
-REMOTE_PATH = get_config_value(config, 'remote_k3s_config_path', "/etc/rancher/k3s/k3s.yaml")
-DEFAULT_KEY = os.path.expanduser(get_config_value(config, 'ssh_key_path', "~/.ssh/id_ed25519"))
-TARGET_PORT = int(get_config_value(config, 'k3s_api_port', 6443))
-PORT_RANGE_START = int(get_config_value(config, 'port_range_start', 16443))
-PORT_RANGE_SIZE = int(get_config_value(config, 'port_range_size', 10000))
+
+# Configuration globals, populated by _bootstrap() at the top of main()
+REMOTE_PATH = "/etc/rancher/k3s/k3s.yaml"
+DEFAULT_KEY = None
+TARGET_PORT = 6443
+PORT_RANGE_START = 16443
+PORT_RANGE_SIZE = 10000
 SSH_CONFIG_PATH = os.path.expanduser("~/.ssh/config")
+INVENTORY_PATH = Path(__file__).parent / "inventory"
+custom_style = None
 
-inventory_from_config = get_config_value(config, 'inventory_path', None)
-if inventory_from_config:
-    INVENTORY_PATH = Path(os.path.expanduser(inventory_from_config))
-else:
-    INVENTORY_PATH = Path(__file__).parent / "inventory"
-
-# Custom style for questionary
-custom_style = Style([
-    ('qmark', 'fg:#E91E63 bold'),
-    ('question', 'bold'),
-    ('answer', 'fg:#2196F3 bold'),
-    ('pointer', 'fg:#E91E63 bold'),
-    ('highlighted', 'fg:#E91E63 bold'),
-    ('selected', 'fg:#E91E63'),
-    ('separator', 'fg:#cc5454'),
-    ('instruction', ''),
-    ('text', ''),
-    ('disabled', 'fg:#858585 italic'),
-    ('checkbox', 'fg:#E91E63 bold'),
-    ('checkbox-selected', 'fg:#E91E63'),
-])
+
+def _bootstrap() -> None:
+    """
+    Load environment, config and questionary style.
+
+    Kept off the import path so `python3 multi_connect.py --help` (or
+    importing this module) doesn't pay for dotenv + config + prompt-toolkit.
+    """
+    global REMOTE_PATH, DEFAULT_KEY, TARGET_PORT, PORT_RANGE_START
+    global PORT_RANGE_SIZE, INVENTORY_PATH, custom_style
+
+    from dotenv import load_dotenv
+    from questionary import Style
+    from src.config import load_config, get_config_value
+
+    load_dotenv()
+
+    config_file = os.getenv("CONFIG_FILE", str(Path(__file__).parent / "config.yaml"))
+    config = load_config(os.path.expanduser(config_file))
+
+    REMOTE_PATH = get_config_value(config, 'remote_k3s_config_path', "/etc/rancher/k3s/k3s.yaml")
+    DEFAULT_KEY = os.path.expanduser(get_config_value(config, 'ssh_key_path', "~/.ssh/id_ed25519"))
+    TARGET_PORT = int(get_config_value(config, 'k3s_api_port', 6443))
+    PORT_RANGE_START = int(get_config_value(config, 'port_range_start', 16443))
+    PORT_RANGE_SIZE = int(get_config_value(config, 'port_range_size', 10000))
+
+    inventory_from_config = get_config_value(config, 'inventory_path', None)
+    if inventory_from_config:
+        INVENTORY_PATH = Path(os.path.expanduser(inventory_from_config))
+
+    # Custom style for questionary
+    custom_style = Style([
+        ('qmark', 'fg:#E91E63 bold'),
+        ('question', 'bold'),
+        ('answer', 'fg:#2196F3 bold'),
+        ('pointer', 'fg:#E91E63 bold'),
+        ('highlighted', 'fg:#E91E63 bold'),
+        ('selected', 'fg:#E91E63'),
+        ('separator', 'fg:#cc5454'),
+        ('instruction', ''),
+        ('text', ''),
+        ('disabled', 'fg:#858585 italic'),
+        ('checkbox', 'fg:#E91E63 bold'),
+        ('checkbox-selected', 'fg:#E91E63'),
+    ])
 
 
 def build_cluster_list(inventory_path: Path) -> List[Dict[str, Any]]:
@@ -103,24 +119,23 @@ def build_cluster_list(inventory_path: Path) -> List[Dict[str, Any]]:
     for company, inv_data in sorted(inventories.items()):
         hosts = extract_hosts_from_inventory(inv_data)
 
+        # Flatten the group-vars walk into one host -> needs_vpn table per
+        # inventory; the hot loop below then only does hash probes
+        vpn_map = build_vpn_map(inv_data)
+
         for host_alias in sorted(hosts.keys()):
             host_info = hosts[host_alias]
-            group = host_info["group"]
 
             # Check network requirements
-            needs_vpn = check_vpn_requirement(inv_data, group, host_alias)
+            needs_vpn = vpn_map.get(host_alias, False)
             network_type, network_range = check_network_requirement(host_alias, host_info)
 
             # Build label with indicators
-            indicators = []
+            label = f"{company}: {host_alias}"
             if needs_vpn:
-                indicators.append("[VPN]")
+                label += " [VPN]"
             if network_type == "sshuttle":
-                indicators.append(f"[sshuttle]")
-
-            label = f"{company}: {host_alias}"
-            if indicators:
-                label += " " + " ".join(indicators)
+                label += " [sshuttle]"
 
             clusters.append({
                 'label': label,
@@ -147,16 +162,20 @@ def show_network_warnings(selected_clusters: List[Dict[str, Any]]) -> bool:
     Returns:
         bool: True if user confirms to continue, False otherwise
     """
-    # Group clusters by network requirement
+    # Group clusters by network requirement and collect sshuttle ranges
+    # in the same pass
     vpn_required = []
     sshuttle_required = []
     direct = []
+    ranges = set()
 
     for cluster in selected_clusters:
         if cluster['needs_vpn']:
             vpn_required.append(cluster)
         elif cluster['network_type'] == 'sshuttle':
             sshuttle_required.append(cluster)
+            if cluster['network_range']:
+                ranges.add(cluster['network_range'])
         else:
             direct.append(cluster)
 
@@ -187,8 +206,6 @@ def show_network_warnings(selected_clusters: List[Dict[str, Any]]) -> bool:
         print("="*60)
 
         if sshuttle_required:
-            # Get unique network ranges
-            ranges = set(c['network_range'] for c in sshuttle_required if c['network_range'])
             for network_range in sorted(ranges):
                 print(f"\n🔒 For {network_range}:")
                 print(f"   sshuttle -v -r helio@100.64.5.10 {network_range}")
@@ -199,6 +216,7 @@ def show_network_warnings(selected_clusters: List[Dict[str, Any]]) -> bool:
     print("\n" + "="*60)
 
     # Ask for confirmation
+    import questionary
     try:
         confirmed = questionary.confirm(
             "Continue with multi-cluster connection?",
@@ -210,6 +228,41 @@ def show_network_warnings(selected_clusters: List[Dict[str, Any]]) -> bool:
         return False
 
 
+# Parsed tunnel PIDs keyed by context name, invalidated by pid-file mtime,
+# so repeated connects in one session skip the open/read/int round trip
+_pid_cache: Dict[str, Tuple[int, int]] = {}
+
+
+def _read_tunnel_pid(context_name: str) -> Optional[int]:
+    """
+    Read (and cache) the PID of an already-running tunnel.
+
+    Args:
+        context_name: Kubernetes context name
+
+    Returns:
+        int|None: Tunnel PID, or None if the pid file is missing/invalid
+    """
+    pid_file = TUNNEL_STATE_DIR / f"{context_name}.pid"
+    try:
+        st = pid_file.stat()
+    except OSError:
+        return None
+
+    cached = _pid_cache.get(context_name)
+    if cached is not None and cached[0] == st.st_mtime_ns:
+        return cached[1]
+
+    try:
+        with open(pid_file) as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+    _pid_cache[context_name] = (st.st_mtime_ns, pid)
+    return pid
+
+
 def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
     """
     Connect to a single cluster.
@@ -218,6 +271,9 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
         cluster: Cluster info dict
         logger: Logger instance
 
+    Progress output is buffered and printed as a single block so that
+    concurrent connections don't interleave their lines.
+
     Returns:
         dict: Connection result
             {
@@ -233,6 +289,7 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
     host_alias = cluster['host_alias']
     host_info = cluster['host_info']
     context_name = f"{company}-{host_alias}"
+    lines = []
 
     result = {
         'success': False,
@@ -245,12 +302,15 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
     }
 
     try:
+        from src.ssh import load_ssh_config
+        from fetch_k3s_config import fetch_and_merge_kubeconfig
+
         # Load SSH config
         ssh_config = load_ssh_config(host_alias, SSH_CONFIG_PATH)
 
         # Fetch and merge kubeconfig
         logger.info(f"Connecting to {context_name}...")
-        print(f"\n📡 Connecting to {context_name}...")
+        lines.append(f"\n📡 Connecting to {context_name}...")
 
         context_name, local_port, internal_ip, new_content, was_cached = fetch_and_merge_kubeconfig(
             company=company,
@@ -267,24 +327,20 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
         result['internal_ip'] = internal_ip
 
         if was_cached:
-            print(f"   ✓ Using cached kubeconfig")
+            lines.append(f"   ✓ Using cached kubeconfig")
         else:
-            print(f"   ✓ Fetched kubeconfig from remote")
+            lines.append(f"   ✓ Fetched kubeconfig from remote")
 
         # Setup tunnel
         if is_tunnel_running(context_name):
-            print(f"   ✓ Tunnel already running")
-            # Get existing PID
-            pid_file = TUNNEL_STATE_DIR / f"{context_name}.pid"
-            if pid_file.exists():
-                with open(pid_file) as f:
-                    result['tunnel_pid'] = int(f.read().strip())
+            lines.append(f"   ✓ Tunnel already running")
+            result['tunnel_pid'] = _read_tunnel_pid(context_name)
         else:
-            print(f"   Creating tunnel: localhost:{local_port} → {internal_ip}:6443")
+            lines.append(f"   Creating tunnel: localhost:{local_port} → {internal_ip}:6443")
             pid = create_tunnel(host_alias, internal_ip, local_port, TARGET_PORT)
             save_tunnel_pid(context_name, pid)
             result['tunnel_pid'] = pid
-            print(f"   ✓ Tunnel created (PID: {pid})")
+            lines.append(f"   ✓ Tunnel created (PID: {pid})")
 
         # Save network metadata
         if cluster['network_type'] or cluster['needs_vpn']:
@@ -301,28 +357,101 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
                 internal_ip=internal_ip
             )
 
-        print(f"   ✓ Context '{context_name}' configured")
+        lines.append(f"   ✓ Context '{context_name}' configured")
         result['success'] = True
 
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Failed to connect to {context_name}: {error_msg}")
-        print(f"   ✗ Failed: {error_msg}")
+        lines.append(f"   ✗ Failed: {error_msg}")
         result['error'] = error_msg
 
+    print("\n".join(lines))
     return result
 
 
+async def _connect_all(selected: List[Dict[str, Any]], logger) -> List[Any]:
+    """
+    Connect to all selected clusters concurrently.
+
+    Each connection is mostly network-bound (SSH + kubeconfig fetch +
+    tunnel), so they run in threads and are awaited together.
+
+    Args:
+        selected: Selected cluster info dicts
+        logger: Logger instance
+
+    Returns:
+        list: Connection results (or exceptions) in selection order
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(connect_cluster, cluster, logger) for cluster in selected),
+        return_exceptions=True
+    )
+
+
+# (yaml module, Loader, Dumper) resolved once on first use — keeps module
+# import cheap while avoiding the per-call import in set_current_context
+_YAML_RUNTIME: Optional[Tuple[Any, Any, Any]] = None
+
+
+def _yaml_runtime() -> Tuple[Any, Any, Any]:
+    global _YAML_RUNTIME
+    if _YAML_RUNTIME is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+        except ImportError:
+            from yaml import SafeLoader as Loader, SafeDumper as Dumper
+        _YAML_RUNTIME = (yaml, Loader, Dumper)
+    return _YAML_RUNTIME
+
+
 def set_current_context(context_name: str) -> bool:
     """
     Set kubectl current context.
 
+    Rewrites current-context directly in the kubeconfig (atomic replace)
+    instead of forking `kubectl config use-context`, which pays a full Go
+    process startup just to flip one YAML key. Falls back to kubectl if
+    the file can't be read or written.
+
     Args:
         context_name: Context name to set
 
     Returns:
         bool: True if successful
     """
+    import stat
+    yaml, Loader, Dumper = _yaml_runtime()
+
+    kubeconfig_env = os.environ.get("KUBECONFIG")
+    kubeconfig = Path(os.path.expanduser(
+        kubeconfig_env.split(os.pathsep)[0] if kubeconfig_env else "~/.kube/config"
+    ))
+
+    try:
+        with open(kubeconfig) as f:
+            data = yaml.load(f, Loader=Loader) or {}
+
+        # Don't silently point at a context that doesn't exist
+        known = {c.get("name") for c in (data.get("contexts") or [])}
+        if context_name not in known:
+            return False
+
+        data["current-context"] = context_name
+
+        mode = stat.S_IMODE(kubeconfig.stat().st_mode)
+        tmp_file = kubeconfig.with_name(kubeconfig.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            yaml.dump(data, f, Dumper=Dumper, default_flow_style=False)
+        os.chmod(tmp_file, mode)
+        os.replace(tmp_file, kubeconfig)
+        return True
+    except (OSError, yaml.YAMLError):
+        pass
+
+    # Fallback: let kubectl handle it (e.g. kubeconfig missing)
     try:
         subprocess.run(
             ["kubectl", "config", "use-context", context_name],
@@ -330,7 +459,7 @@ def set_current_context(context_name: str) -> bool:
             capture_output=True
         )
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
@@ -344,7 +473,10 @@ def select_clusters_interactive(clusters: List[Dict[str, Any]]) -> List[Dict[str
     Returns:
         list: Selected clusters
     """
+    import questionary
+
     selected = []
+    selected_labels = set()  # O(1) membership instead of rescanning selected
     cluster_map = {c['label']: c for c in clusters}
     available_labels = [c['label'] for c in clusters]
 
@@ -361,7 +493,7 @@ def select_clusters_interactive(clusters: List[Dict[str, Any]]) -> List[Dict[str
                 print()
 
             # Filter out already selected clusters
-            remaining = [label for label in available_labels if label not in [c['label'] for c in selected]]
+            remaining = [label for label in available_labels if label not in selected_labels]
 
             if not remaining:
                 print("All clusters selected!")
@@ -380,6 +512,7 @@ def select_clusters_interactive(clusters: List[Dict[str, Any]]) -> List[Dict[str
 
             if choice in cluster_map:
                 selected.append(cluster_map[choice])
+                selected_labels.add(choice)
                 print(f"  ✓ Added: {choice}")
 
         except KeyboardInterrupt:
@@ -390,6 +523,8 @@ def select_clusters_interactive(clusters: List[Dict[str, Any]]) -> List[Dict[str
 
 
 def main():
+    _bootstrap()
+
     log_file_path = os.path.expanduser(os.getenv("K9S_LOG_FILE", "~/.local/state/k9s/k9s-config.log"))
     logger = setup_logging(log_file=log_file_path)
     logger.info("Starting multi-cluster connection")
@@ -421,14 +556,25 @@ def main():
         print("Cancelled.")
         sys.exit(0)
 
-    # Connect to each cluster
+    # Connect to all clusters concurrently
     print("\n" + "="*60)
     print("Connecting to clusters...")
     print("="*60)
 
     results = []
-    for cluster in selected:
-        result = connect_cluster(cluster, logger)
+    for cluster, result in zip(selected, asyncio.run(_connect_all(selected, logger))):
+        if isinstance(result, BaseException):
+            context_name = f"{cluster['company']}-{cluster['host_alias']}"
+            logger.error(f"Failed to connect to {context_name}: {result}")
+            result = {
+                'success': False,
+                'context_name': context_name,
+                'local_port': None,
+                'internal_ip': None,
+                'tunnel_pid': None,
+                'error': str(result),
+                'cluster': cluster
+            }
         results.append(result)
 
     # Show summary
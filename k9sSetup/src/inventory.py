@@ -5,11 +5,38 @@ Handles loading and parsing Ansible-style inventory files with support
 for custom YAML tags like !vault.
 """
 
+import hashlib
+import pickle
 import sys
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Prefer the libyaml C parser when PyYAML was built with it (3-10x faster)
+try:
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseLoader
+
+
+# On-disk cache of parsed inventories, keyed by file path + mtime.
+# Loading a pickle is much faster than re-parsing YAML on every invocation.
+INVENTORY_CACHE_DIR = Path.home() / ".cache" / "k9s" / "inventory"
+
+
+def _inventory_cache_file(inv_file: Path) -> Optional[Path]:
+    """
+    Get the cache file path for an inventory file (None if it can't be stat'd).
+
+    The key hashes path + mtime, so editing the inventory invalidates
+    the cache entry automatically.
+    """
+    try:
+        key = hashlib.sha1(f"{inv_file}:{inv_file.stat().st_mtime_ns}".encode()).hexdigest()
+    except OSError:
+        return None
+    return INVENTORY_CACHE_DIR / f"{key}.pkl"
+
 
 def load_inventories(inventory_path: Optional[Path] = None) -> Dict[str, Any]:
     """
@@ -29,7 +56,7 @@ def load_inventories(inventory_path: Optional[Path] = None) -> Dict[str, Any]:
         return inventories
 
     # Custom YAML loader that ignores unknown tags (like !vault)
-    class VaultIgnoreLoader(yaml.SafeLoader):
+    class VaultIgnoreLoader(_BaseLoader):
         pass
 
     def ignore_unknown_tag(loader: Any, tag_suffix: Any, node: Any) -> Any:
@@ -44,16 +71,71 @@ def load_inventories(inventory_path: Optional[Path] = None) -> Dict[str, Any]:
 
     for inv_file in sorted(inventory_path.glob("*_hosts.yml")):
         company = inv_file.stem.replace("_hosts", "")
+
+        cache_file = _inventory_cache_file(inv_file)
+        if cache_file is not None and cache_file.exists():
+            try:
+                inventories[company] = pickle.loads(cache_file.read_bytes())
+                continue
+            except Exception:
+                pass  # Corrupt cache entry, fall through to re-parse
+
         try:
             with open(inv_file) as f:
                 data = yaml.load(f, Loader=VaultIgnoreLoader)
                 inventories[company] = data
         except Exception as e:
             print(f"Warning: Failed to load {inv_file}: {e}", file=sys.stderr)
+            continue
+
+        if cache_file is not None:
+            try:
+                INVENTORY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(pickle.dumps(data, protocol=5))
+            except OSError:
+                pass  # Cache is best-effort; keep going without it
 
     return inventories
 
 
+def build_vpn_map(inv_data: Any) -> Dict[str, bool]:
+    """
+    Precompute VPN requirements for every host in an inventory.
+
+    Walks the group vars once and flattens the answer into a lookup
+    table, so batch callers (e.g. building the cluster list) do an O(1)
+    probe per host instead of re-descending the inventory dict.
+
+    Args:
+        inv_data: Parsed inventory YAML data
+
+    Returns:
+        dict: {host_name: needs_vpn}
+    """
+    vpn_map: Dict[str, bool] = {}
+    if not isinstance(inv_data, dict) or "all" not in inv_data:
+        return vpn_map
+
+    all_data = inv_data["all"]
+    if "children" not in all_data:
+        return vpn_map
+
+    for group_name, group_data in all_data["children"].items():
+        if not isinstance(group_data, dict):
+            continue
+
+        vars_dict = group_data.get("vars")
+        needs_vpn = bool(vars_dict.get("argocd_use_socks5_proxy", False)) \
+            if isinstance(vars_dict, dict) else False
+
+        hosts_data = group_data.get("hosts")
+        if hosts_data and isinstance(hosts_data, dict):
+            for host_name in hosts_data:
+                vpn_map[host_name] = needs_vpn
+
+    return vpn_map
+
+
 def extract_hosts_from_inventory(inv_data: Any) -> Dict[str, Dict[str, Any]]:
     """
     Extract all hosts from an inventory structure.
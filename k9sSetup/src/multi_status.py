@@ -4,24 +4,80 @@ Status display for multi-cluster connections.
 Shows status of all connected clusters, active tunnels, and network requirements.
 """
 
+import asyncio
+import functools
 import os
 import subprocess
+import sys
+import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from .tunnel import is_tunnel_running, get_tunnel_pid_file, TUNNEL_STATE_DIR
+from .tunnel import probe_tunnel, _iter_pid_files, TUNNEL_STATE_DIR
 from .network_validator import get_network_metadata
 from .logging_config import get_logger
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = get_logger()
 
 
+def _kubeconfig_path() -> Optional[Path]:
+    """
+    Resolve the active kubeconfig path ($KUBECONFIG first entry that
+    exists, else ~/.kube/config).
+
+    Returns:
+        Path|None: Kubeconfig path or None if no file exists
+    """
+    env = os.environ.get("KUBECONFIG")
+    if env:
+        for part in env.split(os.pathsep):
+            if not part:
+                continue
+            candidate = Path(os.path.expanduser(part))
+            if candidate.exists():
+                return candidate
+    default = Path.home() / ".kube" / "config"
+    return default if default.exists() else None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_current_context(path: str, mtime_ns: int) -> Optional[str]:
+    """
+    Parse current-context from a kubeconfig, cached by (path, mtime).
+
+    The mtime key means one show_status() invocation parses the file at
+    most once, and edits invalidate the cache automatically.
+    """
+    with open(path) as f:
+        data = yaml.load(f, Loader=_Loader)
+    if isinstance(data, dict):
+        return data.get("current-context") or None
+    return None
+
+
 def get_current_context() -> Optional[str]:
     """
     Get current kubectl context from kubeconfig.
 
+    Reads the kubeconfig directly instead of forking kubectl (a full Go
+    process startup just to print one string); falls back to the
+    subprocess if the file can't be parsed.
+
     Returns:
         str|None: Current context name or None if not set
     """
+    kubeconfig = _kubeconfig_path()
+    if kubeconfig is not None:
+        try:
+            return _parse_current_context(str(kubeconfig), kubeconfig.stat().st_mtime_ns)
+        except (OSError, yaml.YAMLError):
+            pass
+
     try:
         result = subprocess.run(
             ["kubectl", "config", "current-context"],
@@ -47,21 +103,7 @@ def get_tunnel_pid(context_name: str, state_dir: Optional[Path] = None) -> Optio
     Returns:
         int|None: PID if tunnel is running, None otherwise
     """
-    if state_dir is None:
-        state_dir = TUNNEL_STATE_DIR
-
-    pid_file = get_tunnel_pid_file(context_name, state_dir)
-    if not pid_file.exists():
-        return None
-
-    try:
-        with open(pid_file) as f:
-            pid = int(f.read().strip())
-        # Verify process is still running
-        os.kill(pid, 0)
-        return pid
-    except (ValueError, ProcessLookupError, OSError):
-        return None
+    return probe_tunnel(context_name, state_dir)[1]
 
 
 def get_tunnel_port(context_name: str) -> Optional[int]:
@@ -104,29 +146,46 @@ def list_all_contexts(state_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
     if not state_dir.exists():
         return []
 
-    contexts = []
-
-    # Find all .pid files
-    for pid_file in state_dir.glob("*.pid"):
-        context_name = pid_file.stem
-        tunnel_running = is_tunnel_running(context_name, state_dir)
-        pid = get_tunnel_pid(context_name, state_dir) if tunnel_running else None
-        port = get_tunnel_port(context_name)
-        network_meta = get_network_metadata(context_name, state_dir)
-
-        contexts.append({
+    def _gather_ctx(entry) -> Dict[str, Any]:
+        context_name, _pid_file = entry
+        tunnel_running, pid = probe_tunnel(context_name, state_dir)
+        return {
             'name': context_name,
             'tunnel_running': tunnel_running,
             'tunnel_pid': pid,
-            'local_port': port,
-            'network_metadata': network_meta
-        })
+            'local_port': get_tunnel_port(context_name),
+            'network_metadata': get_network_metadata(context_name, state_dir)
+        }
+
+    # Each context is independent IO (pid read, kill(pid, 0), YAML load),
+    # so probe them concurrently instead of serializing the syscalls
+    pid_files = list(_iter_pid_files(state_dir))
+    with ThreadPoolExecutor(max_workers=min(32, len(pid_files) or 1)) as ex:
+        contexts = list(ex.map(_gather_ctx, pid_files))
 
     # Sort by name
     contexts.sort(key=lambda x: x['name'])
     return contexts
 
 
+async def _gather_status(state_dir: Optional[Path]) -> tuple:
+    """
+    Run the context scan and current-context lookup concurrently.
+
+    Both are independent IO (pid probes + metadata reads vs a
+    kubeconfig parse, or a kubectl subprocess on the fallback path), so
+    the wall time of the pair is the slower of the two rather than
+    their sum.
+
+    Returns:
+        tuple: (contexts, current_context)
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(list_all_contexts, state_dir),
+        asyncio.to_thread(get_current_context),
+    )
+
+
 def show_status(state_dir: Optional[Path] = None) -> None:
     """
     Display formatted status of all clusters.
@@ -134,25 +193,40 @@ def show_status(state_dir: Optional[Path] = None) -> None:
     Args:
         state_dir: Custom state directory
     """
-    # ANSI color codes
-    GREEN = '\033[0;32m'
-    RED = '\033[0;31m'
-    YELLOW = '\033[1;33m'
-    NC = '\033[0m'  # No Color
-
-    contexts = list_all_contexts(state_dir)
-    current_context = get_current_context()
+    # ANSI color codes — suppressed when not writing to a terminal so
+    # piped output isn't littered with escape sequences
+    is_tty = sys.stdout.isatty()
+    GREEN = '\033[0;32m' if is_tty else ''
+    RED = '\033[0;31m' if is_tty else ''
+    YELLOW = '\033[1;33m' if is_tty else ''
+    NC = '\033[0m' if is_tty else ''  # No Color
+
+    # Per-context line templates: the color codes are constant, so
+    # interpolate them once rather than on every iteration
+    up_line = f"  {GREEN}✓{NC} {{name}} (localhost:{{port}}) [PID: {{pid}}]{{warning}}{{current}}"
+    down_line = f"  {RED}✗{NC} {{name}} (tunnel down){{current}}"
+    sshuttle_warning = f" {YELLOW}⚠ requires sshuttle{NC}"
+    vpn_warning = f" {YELLOW}⚠ requires VPN{NC}"
+
+    # Accumulate the report and emit it with a single write at the end
+    # (one syscall on a line-buffered TTY instead of one per print)
+    parts = []
+
+    contexts, current_context = asyncio.run(_gather_status(state_dir))
 
     if not contexts:
-        print(f"{YELLOW}No connected clusters found.{NC}")
-        print(f"\nRun: make run         # Connect single cluster")
-        print(f"     make multi-connect  # Connect multiple clusters")
+        sys.stdout.write(
+            f"{YELLOW}No connected clusters found.{NC}\n"
+            f"\nRun: make run         # Connect single cluster\n"
+            f"     make multi-connect  # Connect multiple clusters\n"
+        )
         return
 
-    print(f"{GREEN}Connected clusters:{NC}")
+    parts.append(f"{GREEN}Connected clusters:{NC}")
 
-    # Collect network requirements
-    network_requirements = []
+    # Collect network requirements, de-duplicated by sshuttle command
+    # at insertion time (contexts behind one gateway share the command)
+    network_requirements: Dict[str, Dict[str, Any]] = {}
 
     for ctx in contexts:
         name = ctx['name']
@@ -160,45 +234,46 @@ def show_status(state_dir: Optional[Path] = None) -> None:
         current_marker = " (active)" if is_current else ""
 
         if ctx['tunnel_running']:
-            port = ctx['local_port']
-            pid = ctx['tunnel_pid']
-            status_icon = f"{GREEN}✓{NC}"
-
             # Check network metadata
             network_meta = ctx['network_metadata']
             network_warning = ""
             if network_meta:
                 network_type = network_meta.get('network_type')
                 if network_type == 'sshuttle':
-                    network_warning = f" {YELLOW}⚠ requires sshuttle{NC}"
-                    network_requirements.append(network_meta)
+                    network_warning = sshuttle_warning
+                    if cmd := network_meta.get('sshuttle_command'):
+                        network_requirements.setdefault(cmd, network_meta)
                 elif network_meta.get('needs_vpn'):
-                    network_warning = f" {YELLOW}⚠ requires VPN{NC}"
-
-            print(f"  {status_icon} {name} (localhost:{port}) [PID: {pid}]{network_warning}{current_marker}")
+                    network_warning = vpn_warning
+
+            parts.append(up_line.format(
+                name=name,
+                port=ctx['local_port'],
+                pid=ctx['tunnel_pid'],
+                warning=network_warning,
+                current=current_marker
+            ))
         else:
-            print(f"  {RED}✗{NC} {name} (tunnel down){current_marker}")
+            parts.append(down_line.format(name=name, current=current_marker))
 
     # Show current context
     if current_context:
-        print(f"\n{GREEN}Current context:{NC} {current_context}")
+        parts.append(f"\n{GREEN}Current context:{NC} {current_context}")
     else:
-        print(f"\n{YELLOW}No current context set{NC}")
+        parts.append(f"\n{YELLOW}No current context set{NC}")
 
     # Show active network requirements
     if network_requirements:
-        print(f"\n{YELLOW}Active network requirements:{NC}")
-        shown_commands = set()
-        for meta in network_requirements:
-            cmd = meta.get('sshuttle_command')
-            if cmd and cmd not in shown_commands:
-                print(f"  🔒 {cmd}")
-                shown_commands.add(cmd)
-
-    print(f"\n{GREEN}Commands:{NC}")
-    print(f"  kubectl config use-context <name>  # Switch context")
-    print(f"  make k9s                           # Launch k9s")
-    print(f"  make tunnel-list                   # List tunnels")
+        parts.append(f"\n{YELLOW}Active network requirements:{NC}")
+        for cmd in network_requirements:
+            parts.append(f"  🔒 {cmd}")
+
+    parts.append(f"\n{GREEN}Commands:{NC}")
+    parts.append(f"  kubectl config use-context <name>  # Switch context")
+    parts.append(f"  make k9s                           # Launch k9s")
+    parts.append(f"  make tunnel-list                   # List tunnels")
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 if __name__ == "__main__":
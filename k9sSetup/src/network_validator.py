@@ -5,14 +5,71 @@ Validates that required network setup (sshuttle/VPN) is active
 before using clusters.
 """
 
+import json
+import os
+import select
 import subprocess
 import socket
+import yaml
 from typing import Optional, Dict, Any
 from pathlib import Path
 from .logging_config import get_logger
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = get_logger()
 
+# Parsed network metadata keyed by (path, mtime_ns) — a changed file
+# gets a new mtime key and the stale entry is evicted on the next read
+_META_CACHE: Dict[tuple, Optional[Dict[str, Any]]] = {}
+
+
+def _find_sshuttle_proc(network_range: str) -> Optional[bool]:
+    """
+    Scan /proc once for a sshuttle process covering a network range.
+
+    One in-process pass over /proc/<pid>/cmdline replaces up to two
+    pgrep fork+execs; both the range-specific and generic matches are
+    answered from the same scan.
+
+    Args:
+        network_range: Network range (e.g., "192.168.90.0/24")
+
+    Returns:
+        bool|None: True/False when /proc could be scanned, None when it
+            can't (e.g. macOS) and the caller should fall back to pgrep
+    """
+    range_bytes = network_range.encode()
+    found_generic = False
+
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return None
+
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # Process exited or is unreadable
+            if b'sshuttle' not in cmdline:
+                continue
+            if range_bytes in cmdline:
+                logger.debug(f"Found sshuttle process for {network_range}")
+                return True
+            found_generic = True
+
+    if found_generic:
+        logger.debug("Found generic sshuttle process")
+    return found_generic
+
 
 def check_sshuttle_active(network_range: str) -> bool:
     """
@@ -24,38 +81,67 @@ def check_sshuttle_active(network_range: str) -> bool:
     Returns:
         bool: True if sshuttle appears to be routing this network
     """
+    found = _find_sshuttle_proc(network_range)
+    if found is not None:
+        return found
+
+    # /proc not available: fall back to a single pgrep listing full
+    # command lines, post-filtered here — one fork/exec instead of two
     try:
-        # Check if there's a sshuttle process running
         result = subprocess.run(
-            ["pgrep", "-f", f"sshuttle.*{network_range}"],
+            ["pgrep", "-af", "sshuttle"],
             capture_output=True,
             text=True,
             timeout=2
         )
-        if result.returncode == 0 and result.stdout.strip():
+        if result.returncode != 0:
+            return False
+
+        lines = result.stdout.splitlines()
+        if any(network_range in line for line in lines):
             logger.debug(f"Found sshuttle process for {network_range}")
             return True
-
-        # Alternative: check for any sshuttle process
-        result = subprocess.run(
-            ["pgrep", "-f", "sshuttle"],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0 and result.stdout.strip():
+        if lines:
             logger.debug("Found generic sshuttle process")
             return True
-
         return False
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
 
+def _start_connect(internal_ip: str) -> Optional[socket.socket]:
+    """
+    Start a non-blocking TCP connect to the K3s API port.
+
+    Returns:
+        socket|None: In-progress socket, or None if the connect failed
+            outright (bad address, no route)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    try:
+        # Try to connect to common K3s API port
+        sock.connect((internal_ip, 6443))
+    except BlockingIOError:
+        pass  # Connect in progress — expected for non-blocking sockets
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _connect_succeeded(sock: socket.socket) -> bool:
+    """Check SO_ERROR on a writable socket to see if the connect landed."""
+    return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+
+
 def validate_network_access(internal_ip: str, timeout: int = 3) -> bool:
     """
     Validate that an internal IP is reachable.
 
+    Uses a non-blocking connect plus poll() instead of a blocking socket
+    so an unreachable host waits on the event loop, not a thread.
+
     Args:
         internal_ip: IP address to test
         timeout: Connection timeout in seconds
@@ -63,17 +149,20 @@ def validate_network_access(internal_ip: str, timeout: int = 3) -> bool:
     Returns:
         bool: True if IP is reachable
     """
-    try:
-        # Try to connect to common K3s API port
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((internal_ip, 6443))
-        sock.close()
+    sock = _start_connect(internal_ip)
+    if sock is None:
+        return False
 
-        # Return code 0 means connection successful
-        return result == 0
-    except (socket.error, socket.timeout):
+    try:
+        poller = select.poll()
+        poller.register(sock, select.POLLOUT)
+        if not poller.poll(timeout * 1000):
+            return False
+        return _connect_succeeded(sock)
+    except OSError:
         return False
+    finally:
+        sock.close()
 
 
 def get_network_metadata(context_name: str, state_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
@@ -99,17 +188,32 @@ def get_network_metadata(context_name: str, state_dir: Optional[Path] = None) ->
         state_dir = Path.home() / ".local" / "state" / "k9s-tunnels"
 
     network_file = state_dir / f"{context_name}.network"
-    if not network_file.exists():
+    try:
+        mtime_ns = network_file.stat().st_mtime_ns
+    except OSError:
         return None
 
+    key = (str(network_file), mtime_ns)
+    if key in _META_CACHE:
+        return _META_CACHE[key]
+
     try:
-        import yaml
-        with open(network_file) as f:
-            return yaml.safe_load(f)
+        text = network_file.read_text()
+        # New files are JSON; fall back to YAML for legacy .network files
+        if text.lstrip().startswith('{'):
+            metadata = json.loads(text)
+        else:
+            metadata = yaml.load(text, Loader=_Loader)
     except Exception as e:
         logger.warning(f"Failed to load network metadata for {context_name}: {e}")
         return None
 
+    # Drop entries for older versions of the same file before caching
+    for stale in [k for k in _META_CACHE if k[0] == key[0]]:
+        del _META_CACHE[stale]
+    _META_CACHE[key] = metadata
+    return metadata
+
 
 def validate_context_network(context_name: str, state_dir: Optional[Path] = None) -> tuple[bool, Optional[str]]:
     """
@@ -5,12 +5,18 @@ Handles creation, lifecycle, and PID file management for SSH tunnels
 used to access K3s clusters.
 """
 
+import functools
+import json
 import os
 import hashlib
+import select
+import socket
 import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from .logging_config import get_logger
 
 logger = get_logger()
@@ -19,7 +25,19 @@ logger = get_logger()
 # Default tunnel state directory
 TUNNEL_STATE_DIR = Path.home() / ".local" / "state" / "k9s-tunnels"
 
+# State directories already created this process — saves a mkdir(2)
+# syscall per pid/metadata file lookup
+_ENSURED: set = set()
 
+
+def _ensure_state_dir(state_dir: Path) -> None:
+    """Create state_dir at most once per process."""
+    if state_dir not in _ENSURED:
+        state_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED.add(state_dir)
+
+
+@functools.lru_cache(maxsize=256)
 def get_unique_port(
     context_name: str,
     port_range_start: int = 16443,
@@ -28,7 +46,9 @@ def get_unique_port(
     """
     Generate a unique port for a context (deterministic based on name).
 
-    Uses MD5 hash of context name to generate a port within specified range.
+    Uses a BLAKE2s hash of the context name to generate a port within the
+    specified range. Results are memoized since the mapping is pure and
+    the same context is looked up repeatedly per session.
     Default range is 16443-26443 (10000 ports).
 
     Args:
@@ -46,15 +66,21 @@ def get_unique_port(
         # Custom range (20000-25000)
         port = get_unique_port("my-context", port_range_start=20000, port_range_size=5000)
     """
-    # Use hash to generate deterministic port within range
-    hash_int = int(hashlib.md5(context_name.encode()).hexdigest()[:4], 16)
-    return port_range_start + (hash_int % port_range_size)
+    # Use hash to generate deterministic port within range; blake2s with a
+    # 2-byte digest gives the same 16 bits of spread as the old truncated
+    # MD5 hexdigest without the hex round-trip
+    digest = hashlib.blake2s(context_name.encode(), digest_size=2).digest()
+    return port_range_start + (int.from_bytes(digest, 'big') % port_range_size)
 
 
+@functools.lru_cache(maxsize=256)
 def get_tunnel_pid_file(context_name: str, state_dir: Optional[Path] = None) -> Path:
     """
     Get the PID file path for a tunnel.
 
+    Memoized — Path construction and the ensure-directory check are
+    repeated per context on every status refresh.
+
     Args:
         context_name: Kubernetes context name
         state_dir: Custom state directory (default: TUNNEL_STATE_DIR)
@@ -65,44 +91,135 @@ def get_tunnel_pid_file(context_name: str, state_dir: Optional[Path] = None) ->
     if state_dir is None:
         state_dir = TUNNEL_STATE_DIR
 
-    state_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_state_dir(state_dir)
     return state_dir / f"{context_name}.pid"
 
 
-def is_tunnel_running(context_name: str, state_dir: Optional[Path] = None) -> bool:
+def _iter_pid_files(state_dir: Path):
     """
-    Check if tunnel for this context is already running.
+    Yield (context_name, pid_file) for every .pid file in state_dir.
+
+    os.scandir avoids the per-entry stat and pattern matching that
+    Path.glob("*.pid") pays for what is a simple suffix check.
+    """
+    with os.scandir(state_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.pid') and entry.is_file(follow_symlinks=False):
+                yield entry.name[:-4], Path(entry.path)
+
+
+def _read_pid(path: Path) -> Optional[int]:
+    """
+    Read a PID from a file with raw os.open/os.read.
+
+    A pid file is at most a few bytes; skipping the TextIOWrapper and
+    buffered-IO setup keeps it to an open/read/close plus int() on the
+    bytes (int() tolerates the trailing newline and whitespace).
+
+    Returns:
+        int|None: PID, or None if the file is missing or malformed
+    """
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+        try:
+            data = os.read(fd, 16)
+        finally:
+            os.close(fd)
+        return int(data)
+    except (OSError, ValueError):
+        return None
+
+
+def probe_tunnel(context_name: str, state_dir: Optional[Path] = None) -> Tuple[bool, Optional[int]]:
+    """
+    Probe a tunnel with one pid-file read and one kill(pid, 0).
+
+    Callers that need both liveness and PID should use this instead of
+    calling is_tunnel_running + a separate PID read, which duplicates
+    the open/parse/kill syscalls per context.
 
     Args:
         context_name: Kubernetes context name
         state_dir: Custom state directory (default: TUNNEL_STATE_DIR)
 
     Returns:
-        bool: True if tunnel is running, False otherwise
+        tuple: (running, pid) — (False, None) if down; stale pid files
+            are removed
     """
     pid_file = get_tunnel_pid_file(context_name, state_dir)
-    if not pid_file.exists():
-        return False
+    pid = _read_pid(pid_file)
+    if pid is None:
+        if pid_file.exists():
+            pid_file.unlink(missing_ok=True)  # Malformed pid file
+        return False, None
 
     try:
-        with open(pid_file) as f:
-            pid = int(f.read().strip())
         # Check if process is still running
         os.kill(pid, 0)
-        return True
-    except (ValueError, ProcessLookupError, OSError):
+        return True, pid
+    except OSError:
         # PID file is stale
         pid_file.unlink(missing_ok=True)
-        return False
+        return False, None
+
+
+def is_tunnel_running(context_name: str, state_dir: Optional[Path] = None) -> bool:
+    """
+    Check if tunnel for this context is already running.
 
+    Args:
+        context_name: Kubernetes context name
+        state_dir: Custom state directory (default: TUNNEL_STATE_DIR)
 
-def kill_tunnel(context_name: str, state_dir: Optional[Path] = None) -> None:
+    Returns:
+        bool: True if tunnel is running, False otherwise
+    """
+    return probe_tunnel(context_name, state_dir)[0]
+
+
+def _wait_for_exit(pid: int, timeout: float) -> None:
+    """
+    Wait for a non-child PID to exit, up to timeout seconds.
+
+    On Linux >= 5.3 this uses pidfd_open + poll for an event-driven
+    wait; elsewhere it falls back to a short sleep loop on kill(pid, 0).
+    """
+    if hasattr(os, 'pidfd_open'):
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:
+            return  # Process already gone (or pidfd unsupported at runtime)
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            poller.poll(int(timeout * 1000))
+        finally:
+            os.close(fd)
+        return
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return
+        time.sleep(0.05)
+
+
+def kill_tunnel(
+    context_name: str,
+    state_dir: Optional[Path] = None,
+    wait: bool = False,
+    timeout: float = 2.0
+) -> None:
     """
     Kill SSH tunnel for a context.
 
     Args:
         context_name: Kubernetes context name
         state_dir: Custom state directory (default: TUNNEL_STATE_DIR)
+        wait: Block until the process actually exits (up to timeout)
+        timeout: Max seconds to wait for exit when wait=True
     """
     pid_file = get_tunnel_pid_file(context_name, state_dir)
     if not pid_file.exists():
@@ -113,18 +230,25 @@ def kill_tunnel(context_name: str, state_dir: Optional[Path] = None) -> None:
             pid = int(f.read().strip())
         os.kill(pid, 15)  # SIGTERM
         logger.info(f"Killed existing tunnel for {context_name} (PID {pid})")
+        if wait:
+            _wait_for_exit(pid, timeout)
     except (ValueError, ProcessLookupError, OSError):
         pass
     finally:
         pid_file.unlink(missing_ok=True)
 
 
-def kill_all_tunnels(state_dir: Optional[Path] = None) -> None:
+def kill_all_tunnels(state_dir: Optional[Path] = None, timeout: float = 2.0) -> None:
     """
     Kill all k9s SSH tunnels.
 
+    SIGTERM is fanned out to every live tunnel first, then the whole
+    set is reaped through a single poll() over pidfds (Linux), so
+    shutdown costs one wait window instead of one per tunnel.
+
     Args:
         state_dir: Custom state directory (default: TUNNEL_STATE_DIR)
+        timeout: Max seconds to wait for the tunnels to exit
     """
     if state_dir is None:
         state_dir = TUNNEL_STATE_DIR
@@ -132,54 +256,132 @@ def kill_all_tunnels(state_dir: Optional[Path] = None) -> None:
     if not state_dir.exists():
         return
 
-    for pid_file in state_dir.glob("*.pid"):
-        context_name = pid_file.stem
-        kill_tunnel(context_name, state_dir)
-
+    # Gather live pids up front, dropping stale pid files as we go
+    live = []
+    for context_name, pid_file in _iter_pid_files(state_dir):
+        try:
+            with open(pid_file) as f:
+                pid = int(f.read().strip())
+            os.kill(pid, 0)
+        except (ValueError, ProcessLookupError, OSError):
+            pid_file.unlink(missing_ok=True)
+            continue
+        live.append((context_name, pid, pid_file))
+
+    if not live:
+        return
 
-def create_tunnel(ssh_host: str, internal_ip: str, local_port: int, remote_port: int = 6443) -> Optional[int]:
+    if hasattr(os, 'pidfd_open'):
+        poller = select.poll()
+        fds = []
+        for context_name, pid, _pid_file in live:
+            try:
+                fd = os.pidfd_open(pid)
+            except OSError:
+                fd = None  # Exited between the liveness check and now
+            try:
+                os.kill(pid, 15)  # SIGTERM
+                logger.info(f"Killed existing tunnel for {context_name} (PID {pid})")
+            except OSError:
+                pass
+            if fd is not None:
+                poller.register(fd, select.POLLIN)
+                fds.append(fd)
+        try:
+            remaining = len(fds)
+            deadline = time.monotonic() + timeout
+            while remaining > 0:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                events = poller.poll(left * 1000)
+                if not events:
+                    break
+                for fd, _event in events:
+                    poller.unregister(fd)
+                remaining -= len(events)
+        finally:
+            for fd in fds:
+                os.close(fd)
+        for _context_name, _pid, pid_file in live:
+            pid_file.unlink(missing_ok=True)
+    else:
+        # No pidfds: terminate concurrently via kill_tunnel instead
+        with ThreadPoolExecutor(max_workers=min(32, len(live))) as ex:
+            for context_name, _pid, _pid_file in live:
+                ex.submit(kill_tunnel, context_name, state_dir, wait=True, timeout=timeout)
+
+
+def create_tunnel(
+    ssh_host: str,
+    internal_ip: str,
+    local_port: int,
+    remote_port: int = 6443,
+    timeout: float = 30.0
+) -> int:
     """
     Create SSH tunnel in background and return PID.
 
+    ssh runs without -f so it stays our direct child and Popen owns the
+    PID — no settling sleep and no pgrep round-trip to rediscover it.
+    start_new_session detaches the tunnel so it outlives this process.
+    Returns only once the local forward actually accepts connections
+    (ExitOnForwardFailure makes any connect/auth/bind failure exit ssh,
+    which is caught and raised with its stderr).
+
+    stderr goes to an unlinked temp file rather than a pipe: nothing
+    drains a pipe after startup, so a chatty ssh would eventually block
+    on it — and writing to it after this CLI exits would SIGPIPE the
+    tunnel.
+
     Args:
         ssh_host: SSH host alias (from ~/.ssh/config)
         internal_ip: Internal IP of the K3s server
         local_port: Local port to listen on
         remote_port: Remote K3s API port (default: 6443)
+        timeout: Max seconds to wait for the forward to come up
 
     Returns:
-        int|None: PID of tunnel process, or None if couldn't determine
+        int: PID of tunnel process
 
     Raises:
         RuntimeError: If tunnel creation fails
     """
     cmd = [
-        "ssh", "-f", "-N",
+        "ssh", "-N",
         "-o", "ExitOnForwardFailure=yes",
         "-o", "ServerAliveInterval=60",
         "-L", f"{local_port}:{internal_ip}:{remote_port}",
         ssh_host
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to create SSH tunnel: {result.stderr}")
-
-    # Find the PID of the SSH tunnel we just created
-    # Give it a moment to establish
-    time.sleep(0.5)
-
-    find_pid = subprocess.run(
-        ["pgrep", "-f", f"ssh.*{local_port}:{internal_ip}:{remote_port}"],
-        capture_output=True,
-        text=True
-    )
-
-    if find_pid.returncode == 0 and find_pid.stdout.strip():
-        return int(find_pid.stdout.strip().split()[0])
-
-    # Fallback: assume it worked, we'll verify later
-    return None
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+            start_new_session=True
+        )
+
+        def _stderr() -> str:
+            stderr_file.seek(0)
+            return stderr_file.read().decode(errors="replace")
+
+        # Wait for ssh to connect, authenticate, and bind the forward
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"Failed to create SSH tunnel: {_stderr()}")
+            try:
+                with socket.create_connection(("127.0.0.1", local_port), timeout=0.25):
+                    return proc.pid
+            except OSError:
+                time.sleep(0.1)
+
+        proc.terminate()
+        raise RuntimeError(
+            f"SSH tunnel did not come up within {timeout}s: {_stderr()}"
+        )
 
 
 def save_tunnel_pid(context_name: str, pid: Optional[int], state_dir: Optional[Path] = None) -> None:
@@ -193,14 +395,20 @@ def save_tunnel_pid(context_name: str, pid: Optional[int], state_dir: Optional[P
     """
     if pid:
         pid_file = get_tunnel_pid_file(context_name, state_dir)
-        with open(pid_file, 'w') as f:
-            f.write(str(pid))
+        fd = os.open(str(pid_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, str(pid).encode())
+        finally:
+            os.close(fd)
 
 
+@functools.lru_cache(maxsize=256)
 def get_network_metadata_file(context_name: str, state_dir: Optional[Path] = None) -> Path:
     """
     Get the network metadata file path for a context.
 
+    Memoized, like get_tunnel_pid_file.
+
     Args:
         context_name: Kubernetes context name
         state_dir: Custom state directory (default: TUNNEL_STATE_DIR)
@@ -211,7 +419,7 @@ def get_network_metadata_file(context_name: str, state_dir: Optional[Path] = Non
     if state_dir is None:
         state_dir = TUNNEL_STATE_DIR
 
-    state_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_state_dir(state_dir)
     return state_dir / f"{context_name}.network"
 
 
@@ -254,9 +462,10 @@ def save_network_metadata(
     network_file = get_network_metadata_file(context_name, state_dir)
 
     try:
-        import yaml
-        with open(network_file, 'w') as f:
-            yaml.safe_dump(metadata, f, default_flow_style=False)
+        # The metadata is a flat dict of a few scalars — JSON covers it
+        # and skips PyYAML's emitter (and its import) on the write path;
+        # readers fall back to YAML for legacy files
+        network_file.write_text(json.dumps(metadata))
         logger.debug(f"Saved network metadata for {context_name}")
     except Exception as e:
         logger.warning(f"Failed to save network metadata for {context_name}: {e}")
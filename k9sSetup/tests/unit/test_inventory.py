@@ -4,7 +4,7 @@ import pytest
 import tempfile
 import yaml
 from pathlib import Path
-from src.inventory import load_inventories, extract_hosts_from_inventory
+from src.inventory import load_inventories, extract_hosts_from_inventory, build_vpn_map
 
 
 class TestLoadInventories:
@@ -187,3 +187,33 @@ class TestExtractHostsFromInventory:
         hosts = extract_hosts_from_inventory(inv_data)
 
         assert hosts == {}
+
+
+class TestBuildVpnMap:
+    """Tests for build_vpn_map function."""
+
+    def test_flags_hosts_in_vpn_groups(self):
+        """Hosts in groups with argocd_use_socks5_proxy get needs_vpn=True."""
+        inv_data = {
+            "all": {
+                "children": {
+                    "vpn_cluster": {
+                        "vars": {"argocd_use_socks5_proxy": True},
+                        "hosts": {"host1": {}, "host2": {}}
+                    },
+                    "open_cluster": {
+                        "hosts": {"host3": {}}
+                    }
+                }
+            }
+        }
+
+        vpn_map = build_vpn_map(inv_data)
+
+        assert vpn_map == {"host1": True, "host2": True, "host3": False}
+
+    def test_returns_empty_for_invalid_inventory(self):
+        """Returns empty dict for malformed inventory."""
+        assert build_vpn_map({}) == {}
+        assert build_vpn_map({"all": {}}) == {}
+        assert build_vpn_map(None) == {}
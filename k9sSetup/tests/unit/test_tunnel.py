@@ -188,9 +188,10 @@ class TestKillAllTunnels:
         """Does nothing when state directory doesn't exist."""
         kill_all_tunnels(Path("/nonexistent"))
 
-    @patch('src.tunnel.kill_tunnel')
-    def test_kills_all_tunnels(self, mock_kill_tunnel):
-        """Kills all tunnels found in state directory."""
+    @patch('src.tunnel.os.pidfd_open', side_effect=OSError, create=True)
+    @patch('src.tunnel.os.kill')
+    def test_kills_all_tunnels(self, mock_kill, mock_pidfd_open):
+        """Sends SIGTERM to every tunnel and removes its PID file."""
         with tempfile.TemporaryDirectory() as tmpdir:
             state_dir = Path(tmpdir)
 
@@ -202,52 +203,59 @@ class TestKillAllTunnels:
 
             kill_all_tunnels(state_dir)
 
-            assert mock_kill_tunnel.call_count == 2
+            sigterms = [c for c in mock_kill.call_args_list if c.args[1] == 15]
+            assert len(sigterms) == 2
+            assert list(state_dir.glob("*.pid")) == []
 
 
 class TestCreateTunnel:
     """Tests for create_tunnel function."""
 
-    @patch('subprocess.run')
-    @patch('time.sleep')
-    def test_creates_tunnel_successfully(self, mock_sleep, mock_run):
-        """Creates SSH tunnel and returns PID."""
-        # Mock subprocess calls
-        mock_run.side_effect = [
-            Mock(returncode=0, stderr=""),  # ssh command
-            Mock(returncode=0, stdout="12345\n")  # pgrep command
-        ]
+    @patch('src.tunnel.socket.create_connection')
+    @patch('subprocess.Popen')
+    def test_creates_tunnel_successfully(self, mock_popen, mock_connect):
+        """Returns the child PID once the local forward accepts connections."""
+        mock_popen.return_value = Mock(pid=12345, poll=Mock(return_value=None))
+        mock_connect.return_value = MagicMock()
 
         pid = create_tunnel("testhost", "10.0.0.1", 16443, 6443)
 
         assert pid == 12345
-        mock_run.assert_any_call(
-            ["ssh", "-f", "-N", "-o", "ExitOnForwardFailure=yes",
-             "-o", "ServerAliveInterval=60", "-L", "16443:10.0.0.1:6443", "testhost"],
-            capture_output=True,
-            text=True
-        )
-
-    @patch('subprocess.run')
-    def test_raises_error_on_tunnel_failure(self, mock_run):
-        """Raises RuntimeError when SSH tunnel creation fails."""
-        mock_run.return_value = Mock(returncode=1, stderr="Connection failed")
+        assert mock_popen.call_args.args[0] == [
+            "ssh", "-N", "-o", "ExitOnForwardFailure=yes",
+            "-o", "ServerAliveInterval=60", "-L", "16443:10.0.0.1:6443", "testhost"
+        ]
+        mock_connect.assert_called_once()
+
+    @patch('subprocess.Popen')
+    def test_raises_error_on_tunnel_failure(self, mock_popen):
+        """Raises RuntimeError when ssh exits before the forward is up."""
+        mock_popen.return_value = Mock(poll=Mock(return_value=255))
 
         with pytest.raises(RuntimeError, match="Failed to create SSH tunnel"):
             create_tunnel("testhost", "10.0.0.1", 16443)
 
-    @patch('subprocess.run')
-    @patch('time.sleep')
-    def test_returns_none_when_pid_not_found(self, mock_sleep, mock_run):
-        """Returns None when pgrep can't find tunnel process."""
-        mock_run.side_effect = [
-            Mock(returncode=0, stderr=""),  # ssh command
-            Mock(returncode=1, stdout="")   # pgrep fails
-        ]
+    @patch('src.tunnel.socket.create_connection', side_effect=OSError)
+    @patch('subprocess.Popen')
+    def test_raises_error_when_forward_never_comes_up(self, mock_popen, mock_connect):
+        """Terminates ssh and raises when the port never starts listening."""
+        mock_popen.return_value = Mock(poll=Mock(return_value=None))
+
+        with pytest.raises(RuntimeError, match="did not come up"):
+            create_tunnel("testhost", "10.0.0.1", 16443, timeout=0.2)
+
+        mock_popen.return_value.terminate.assert_called_once()
+
+    @patch('src.tunnel.socket.create_connection')
+    @patch('subprocess.Popen')
+    def test_detaches_tunnel_session(self, mock_popen, mock_connect):
+        """Starts the tunnel in its own session so it survives the CLI."""
+        mock_popen.return_value = Mock(pid=12345, poll=Mock(return_value=None))
+        mock_connect.return_value = MagicMock()
 
-        pid = create_tunnel("testhost", "10.0.0.1", 16443)
+        create_tunnel("testhost", "10.0.0.1", 16443)
 
-        assert pid is None
+        assert mock_popen.call_args.kwargs['start_new_session'] is True
 
 
 class TestSaveTunnelPid: